@@ -575,9 +575,19 @@ class Graph:
         return current
 
     @property
-    def _body(self) -> mlir.Block:
+    def current_block(self) -> mlir.Block:
+        """The block that new ops are currently staged into.
+
+        This is the graph body, or a nested block while ops are being built
+        inside a region such as the branch of a conditional or a loop body.
+        Values staged in one block can't be used from an unrelated block.
+        """
         return self._current_block
 
+    @property
+    def _body(self) -> mlir.Block:
+        return self.current_block
+
     def _add_op_generated(
         self, op_type: type[Operation], *args, **kwargs
     ) -> list[Value]:
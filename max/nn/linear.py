@@ -17,16 +17,17 @@ from __future__ import annotations
 
 import os
 from collections.abc import Iterable, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from functools import partial
-from typing import Callable
+from typing import Any, Callable
 
 import numpy as np
 from max.dtype import DType
 from max.graph import (
     BufferValue,
     DeviceRef,
+    Graph,
     ShardingStrategy,
     TensorValue,
     TensorValueLike,
@@ -48,6 +49,48 @@ from .kernels import (
 )
 from .layer import Layer, Module, Shardable
 
+_StagedValues = dict[str, tuple[Any, tuple[Any, ...], TensorValue]]
+
+
+# Dependencies compared by value. Everything else (weights, graph values,
+# arrays) is compared by identity: `TensorValue.__eq__` stages an op and
+# `np.ndarray.__eq__` is elementwise.
+_VALUE_DEPENDENCY_TYPES = (DeviceRef, int, float)
+
+
+def _same_dependency(a: Any, b: Any) -> bool:
+    if a is b:
+        return True
+    return (
+        isinstance(a, _VALUE_DEPENDENCY_TYPES) and type(a) is type(b) and a == b
+    )
+
+
+def _stage_once(
+    staged: _StagedValues,
+    key: str,
+    dependencies: tuple[Any, ...],
+    build: Callable[[], TensorValue],
+) -> TensorValue:
+    """Returns ``build()``, staging it at most once per graph block.
+
+    Staged values are only valid inside the block that created them, so a
+    cached value is reused only when the layer is called again from the same
+    block with the same ``dependencies``. A new graph, a subgraph, or a
+    replaced weight or device stages a fresh value.
+    """
+    block = Graph.current.current_block
+    if (entry := staged.get(key)) is not None:
+        staged_block, staged_dependencies, value = entry
+        if staged_block is block and all(
+            _same_dependency(a, b)
+            for a, b in zip(staged_dependencies, dependencies)
+        ):
+            return value
+    value = build()
+    staged[key] = (block, dependencies, value)
+    return value
+
 
 class Float8ScaleGranularity(Enum):
     """Specifies the granularity of the quantization scale factor.
@@ -193,7 +236,9 @@ class Linear(Module, Shardable):
 
     weight: Weight
     """The weight matrix stored on CPU with shape (out_dim, in_dim).
-    Model init transposes the weight and moves it to :obj:`device`."""
+    Model init moves the weight to :obj:`device`. The weight keeps its
+    checkpoint layout: the transpose applied in :obj:`__call__` is folded into
+    the matmul kernel (``transpose_b``) rather than materialized."""
 
     bias: Weight | None = None
     """The optional bias vector stored on CPU with shape (out_dim,).
@@ -240,6 +285,7 @@ class Linear(Module, Shardable):
         self.device = device
         self.clip_weight = clip_weight
         self.float8_config = float8_config
+        self._staged_values: _StagedValues = {}
 
         self.weight = Weight(
             name=f"{name}.weight" if name else "weight",
@@ -434,8 +480,13 @@ class Linear(Module, Shardable):
             ValueError: If the last dimension of ``x`` doesn't match ``in_dim``.
         """
         weight: TensorValue = self.weight
-        if self.clip_weight:
-            weight = clamp(weight, -self.clip_weight, self.clip_weight)
+        if clip_weight := self.clip_weight:
+            weight = _stage_once(
+                self._staged_values,
+                "weight",
+                (self.weight, clip_weight),
+                lambda: clamp(self.weight, -clip_weight, clip_weight),
+            )
 
         if self.weight.quantization_encoding:
             res = ops.qmatmul(
@@ -456,15 +507,28 @@ class Linear(Module, Shardable):
                     x, scales_type=weight_scale.dtype
                 )
 
-                if self.device:
-                    weight_scale = weight_scale.to(self.device)
+                if device := self.device:
+                    weight_scale = _stage_once(
+                        self._staged_values,
+                        "weight_scale",
+                        (self.weight_scale, device),
+                        lambda: TensorValue(self.weight_scale).to(device),
+                    )
 
                 res = dynamic_scaled_matmul(
                     x, weight, x_scales, weight_scale, out_type=DType.bfloat16
                 )
         else:
-            res = x @ weight.T
+            res = x @ _stage_once(
+                self._staged_values,
+                "weight_t",
+                (self.weight, self.clip_weight),
+                lambda: weight.T,
+            )
 
+        # Keep the bias add as the direct consumer of the matmul: the graph
+        # compiler fuses it into the matmul output lambda, so no separate
+        # pass over the output is needed.
         if self.bias is not None:
             res += self.bias
         return res
@@ -619,18 +683,42 @@ class LinearV1(Layer):
 
     weight: TensorValueLike
     bias: TensorValueLike | None = None
+    _staged_values: _StagedValues = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def __call__(self, x: TensorValue) -> TensorValue:
-        weight = TensorValue(self.weight)
-        if weight.type.device != x.type.device:
-            weight = weight.to(x.type.device)
-        res = x @ weight.T
-        if self.bias is not None:
+        device = x.type.device
+
+        def stage_weight_t() -> TensorValue:
+            weight = TensorValue(self.weight)
+            if weight.type.device != device:
+                weight = weight.to(device)
+            return weight.T
+
+        res = x @ _stage_once(
+            self._staged_values,
+            "weight_t",
+            (self.weight, device),
+            stage_weight_t,
+        )
+        return self._add_bias(res)
+
+    def _add_bias(self, res: TensorValue) -> TensorValue:
+        """Adds the bias, if any, staging it on ``res``'s device once."""
+        if self.bias is None:
+            return res
+        device = res.type.device
+
+        def stage_bias() -> TensorValue:
             bias = TensorValue(self.bias)
-            if bias.type.device != x.type.device:
-                bias = bias.to(x.type.device)
-            res += bias
-        return res
+            if bias.type.device != device:
+                bias = bias.to(device)
+            return bias
+
+        return res + _stage_once(
+            self._staged_values, "bias", (self.bias, device), stage_bias
+        )
 
     @classmethod
     def create(
@@ -712,13 +800,15 @@ class QLinearV1(LinearV1):
 
     def __call__(self, x: TensorValue) -> TensorValue:
         assert self.quantization_encoding is not None
-        weight = TensorValue(self.weight)
-        weight = weight.to(x.type.device)
+        device = x.type.device
+        weight = _stage_once(
+            self._staged_values,
+            "weight",
+            (self.weight, device),
+            lambda: TensorValue(self.weight).to(device),
+        )
         res = ops.qmatmul(self.quantization_encoding, None, x, weight)
-        if self.bias is not None:
-            bias = TensorValue(self.bias).to(x.type.device or DeviceRef.CPU())
-            res += bias
-        return res
+        return self._add_bias(res)
 
 
 @dataclass
@@ -765,12 +855,14 @@ class GPTQLinearV1(QLinearV1):
                 reshaped = ops.reshape(
                     weight_bytes,
                     (orig.shape[0] * orig.dtype.size_in_bytes, orig.shape[1]),
-                ).transpose(0, 1)
+                )
                 quantized_weights.append(reshaped)
 
+            # Stacking the byte rows is the same packing as transposing,
+            # concatenating along axis 1 and transposing back.
             weight = ops.concat(
-                (quantized_weights[0], quantized_weights[1]), axis=1
-            ).transpose(0, 1)
+                (quantized_weights[0], quantized_weights[1]), axis=0
+            )
 
             if desc_act:
                 perm_idx = weights.g_idx.allocate(DType.int32, [out_features])
@@ -800,9 +892,19 @@ class GPTQLinearV1(QLinearV1):
 
     def __call__(self, x: TensorValue) -> TensorValue:
         assert self.quantization_encoding is not None
-        weight = TensorValue(self.weight)
+        weight = _stage_once(
+            self._staged_values,
+            "weight",
+            (self.weight,),
+            lambda: TensorValue(self.weight),
+        )
         if self.perm_idx is not None:
-            perm_idx = TensorValue(self.perm_idx)
+            perm_idx = _stage_once(
+                self._staged_values,
+                "perm_idx",
+                (self.perm_idx,),
+                lambda: TensorValue(self.perm_idx),
+            )
             res = ops.qmatmul(
                 self.quantization_encoding,
                 self.quantization_config,
@@ -814,9 +916,7 @@ class GPTQLinearV1(QLinearV1):
             res = ops.qmatmul(
                 self.quantization_encoding, self.quantization_config, x, weight
             )
-        if self.bias is not None:
-            res += TensorValue(self.bias)
-        return res
+        return self._add_bias(res)
 
 
 @dataclass
@@ -857,6 +957,7 @@ class GPTQLinear(Linear):
         # Skip Linear initialization.
         Module.__init__(self)
         self.device = device
+        self._staged_values: _StagedValues = {}
         self.qweight = Weight(
             name="qweight",
             dtype=DType.uint8,
@@ -886,26 +987,44 @@ class GPTQLinear(Linear):
                 "perm_idx", DType.int32, [in_dim], device=device
             )
 
-    def __call__(self, x: TensorValue) -> TensorValue:
-        assert self.qweight.quantization_encoding is not None
+    def _packed_weight(self) -> TensorValue:
+        # Packs the raw qweight bytes and scale bytes into the
+        # `(K_packed, N)` layout expected by the GPTQ repack kernel. Stacking
+        # along the leading axis is equivalent to transposing both, joining
+        # along axis 1 and transposing back, without staging the transposes.
         qweight_dtype, qweight_shape = self.qweight.original_dtype_and_shape
         qweight = ops.reshape(
             self.qweight,
             (qweight_shape[0] * qweight_dtype.size_in_bytes, qweight_shape[1]),
-        ).transpose(0, 1)
+        )
 
         scales_dtype, scales_shape = self.scales.original_dtype_and_shape
         scales = ops.reshape(
             self.scales,
             (scales_shape[0] * scales_dtype.size_in_bytes, scales_shape[1]),
-        ).transpose(0, 1)
-        weight = ops.concat((qweight, scales), axis=1).transpose(0, 1)
+        )
+        weight = ops.concat((qweight, scales), axis=0)
         if self.device:
             weight = weight.to(self.device)
+        return weight
+
+    def __call__(self, x: TensorValue) -> TensorValue:
+        assert self.qweight.quantization_encoding is not None
+        weight = _stage_once(
+            self._staged_values,
+            "weight",
+            (self.qweight, self.scales, self.device),
+            self._packed_weight,
+        )
         if self.perm_idx is not None:
             perm_idx: TensorValue = self.perm_idx
-            if self.device:
-                perm_idx = perm_idx.to(self.device)
+            if device := self.device:
+                perm_idx = _stage_once(
+                    self._staged_values,
+                    "perm_idx",
+                    (self.perm_idx, device),
+                    lambda: TensorValue(self.perm_idx).to(device),
+                )
             res = ops.qmatmul(
                 self.qweight.quantization_encoding,
                 self.quantization_config,
@@ -921,7 +1040,7 @@ class GPTQLinear(Linear):
                 weight,
             )
         if self.bias is not None:
-            res += TensorValue(self.bias)
+            res += self.bias
         return res
 
 
@@ -937,12 +1056,13 @@ class MLPV1(Layer):
     up_proj: LinearV1
 
     def __call__(self, x: TensorValueLike) -> TensorValue:
+        x = TensorValue(x)
         if (
             self.gate_proj.bias is None
             and self.up_proj.bias is None
-            and TensorValue(x).rank == 2
-            and TensorValue(x).device is not None
-            and TensorValue(x).device != DeviceRef.CPU()
+            and x.rank == 2
+            and x.device is not None
+            and x.device != DeviceRef.CPU()
             and False  # GEX-1476: This causes elaboration errors - disable swish_glu pathway.
         ):
             return self.down_proj(
@@ -1056,12 +1176,13 @@ class MLP(Module):
         self.activation_function = _ACTIVATION_FUNCTIONS[activation_function]
 
     def __call__(self, x: TensorValueLike) -> TensorValue:
+        x = TensorValue(x)
         if (
             self.gate_proj.bias is None
             and self.up_proj.bias is None
-            and TensorValue(x).rank == 2
-            and TensorValue(x).device is not None
-            and TensorValue(x).device != DeviceRef.CPU()
+            and x.rank == 2
+            and x.device is not None
+            and x.device != DeviceRef.CPU()
             and False  # GEX-1476: This causes elaboration errors - disable swish_glu pathway.
         ):
             return self.down_proj(
@@ -1069,8 +1190,7 @@ class MLP(Module):
             )
         if self.quantization_encoding or self.float8_config:
             return self.down_proj(
-                self.activation_function(self.gate_proj(TensorValue(x)))
-                * self.up_proj(TensorValue(x))
+                self.activation_function(self.gate_proj(x)) * self.up_proj(x)
             )
         else:
             # Optimization to compute a single matmul by merging the
@@ -63,8 +63,7 @@ def register_all_models() -> None:
         qwen3_arch,
     ]
 
-    for arch in architectures:
-        PIPELINE_REGISTRY.register(arch)
+    PIPELINE_REGISTRY.register_many(architectures)
 
     _MODELS_ALREADY_REGISTERED = True
 
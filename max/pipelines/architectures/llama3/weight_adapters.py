@@ -41,11 +41,17 @@ def convert_safetensor_state_dict(
         new_state_dict[max_name] = value.data()
     if pipeline_config.model_config._quant_config:
         # hack: argsort the perm_idx array
+        # Projections reading the same activations (q/k/v, gate/up) share a
+        # g_idx, so each distinct one is only argsorted once.
+        perm_idx_by_g_idx: dict[bytes, np.ndarray] = {}
         for key, weight_data in new_state_dict.items():
             if key.endswith("perm_idx"):
-                new_state_dict[key] = WeightData.from_numpy(
-                    np.argsort(weight_data.data).astype(np.int32), key
-                )
+                g_idx_bytes = weight_data.data.tobytes()
+                perm_idx = perm_idx_by_g_idx.get(g_idx_bytes)
+                if perm_idx is None:
+                    perm_idx = np.argsort(weight_data.data).astype(np.int32)
+                    perm_idx_by_g_idx[g_idx_bytes] = perm_idx
+                new_state_dict[key] = WeightData.from_numpy(perm_idx, key)
     if (
         pipeline_config.model_config.quantization_encoding
         == SupportedEncoding.gptq
@@ -15,6 +15,7 @@
 
 from __future__ import annotations
 
+import functools
 from enum import Enum
 from typing import Optional
 
@@ -79,6 +80,7 @@ class SupportedEncoding(str, Enum):
     gptq = "gptq"
 
     @classmethod
+    @functools.lru_cache(maxsize=512)
     def parse_from_file_name(cls, name: str):
         # TODO(AITLIB-127): Robustify detection of quantization encoding
         name = name.lower()
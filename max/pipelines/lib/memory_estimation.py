@@ -16,7 +16,6 @@
 from __future__ import annotations
 
 import logging
-from io import StringIO
 from typing import TYPE_CHECKING, cast
 
 from max.driver import Device
@@ -35,6 +34,45 @@ from .pipeline import KVCacheMixin, PipelineModel
 
 logger = logging.getLogger("max.pipelines")
 
+_NO_VALID_CONFIG_SUGGESTION = "reducing --max-length or --max-batch-size, finding a smaller model, or using a device with more memory."
+_REDUCE_LENGTH = "reducing --max-length to {inferred_max_length} (supports batch size of {inferred_max_length_compatible_batch_size})"
+_REDUCE_LENGTH_AND_BATCH = "reducing --max-length to {inferred_max_length} and --max-batch-size to {inferred_max_length_compatible_batch_size})"
+_SET_LENGTH_AND_BATCH = "setting --max-length to {inferred_max_length} and --max-batch-size to {inferred_max_length_compatible_batch_size})"
+_REDUCE_BATCH = "reducing --max-batch-size to {inferred_max_batch_size}"
+_SET_BATCH = "setting --max-batch-size to {inferred_max_batch_size}"
+_SET_DEFAULTED_LENGTH = "setting --max-length to {inferred_max_length} (currently defaulted to {original_max_length})"
+
+# OOM error suggestions, keyed on (user_provided_max_length,
+# user_provided_max_batch_size, found_valid_max_length,
+# found_valid_max_batch_size). This encodes the truth table documented on
+# MemoryEstimator._raise_oom_error; the templates are filled with the inferred
+# values via `str.format_map`.
+_OOM_SUGGESTION_TEMPLATES: dict[tuple[bool, bool, bool, bool], str] = {
+    **{
+        (user_max_length, user_max_batch_size, False, False): (
+            _NO_VALID_CONFIG_SUGGESTION
+        )
+        for user_max_length in (True, False)
+        for user_max_batch_size in (True, False)
+    },
+    # max_length set by user, max_batch_size set to default.
+    (True, False, True, False): _REDUCE_LENGTH,
+    (True, False, True, True): _REDUCE_LENGTH,
+    (True, False, False, True): "reducing --max-length or --max-batch-size",
+    # max_length and max_batch_size set by user.
+    (True, True, True, False): _REDUCE_LENGTH_AND_BATCH,
+    (True, True, False, True): _REDUCE_BATCH,
+    (True, True, True, True): f"{_REDUCE_LENGTH_AND_BATCH} or {_REDUCE_BATCH}",
+    # max_length and max_batch_size set to default.
+    (False, False, True, False): _SET_LENGTH_AND_BATCH,
+    (False, False, False, True): _SET_BATCH,
+    (False, False, True, True): f"{_SET_LENGTH_AND_BATCH} or {_SET_BATCH}",
+    # max_length set to default, max_batch_size set by user.
+    (False, True, True, False): _SET_DEFAULTED_LENGTH,
+    (False, True, False, True): _REDUCE_BATCH,
+    (False, True, True, True): f"{_REDUCE_BATCH} or {_SET_DEFAULTED_LENGTH}",
+}
+
 
 class MemoryEstimator:
     def estimate_memory_footprint(
@@ -73,9 +111,10 @@ class MemoryEstimator:
                 "Try running a smaller model, using a smaller precision, or using a device with more memory."
             )
 
+        kv_cache_config = model_config.kv_cache_config
         total_size = model_weights_size
         available_kv_cache_memory = int(
-            free_memory * model_config.kv_cache_config.device_memory_utilization
+            free_memory * kv_cache_config.device_memory_utilization
             - model_weights_size
         )
         available_kv_cache_memory = max(0, available_kv_cache_memory)
@@ -92,6 +131,7 @@ class MemoryEstimator:
         if not model_config.quantization_encoding:
             msg = "quantization_encoding must be provided in pipeline_config"
             raise ValueError(msg)
+        cache_dtype = model_config.quantization_encoding.cache_dtype
 
         if not user_provided_max_batch_size:
             pipeline_config.max_batch_size = self._infer_optimal_batch_size(
@@ -100,8 +140,8 @@ class MemoryEstimator:
                 available_kv_cache_memory,
                 huggingface_config=huggingface_config,
                 devices=devices,
-                kv_cache_config=model_config.kv_cache_config,
-                cache_dtype=model_config.quantization_encoding.cache_dtype,
+                kv_cache_config=kv_cache_config,
+                cache_dtype=cache_dtype,
             )
 
         actual_kv_cache_size = self._calculate_kv_cache_size(
@@ -110,13 +150,11 @@ class MemoryEstimator:
             available_kv_cache_memory,
             huggingface_config,
             devices=devices,
-            kv_cache_config=model_config.kv_cache_config,
-            cache_dtype=model_config.quantization_encoding.cache_dtype,
+            kv_cache_config=kv_cache_config,
+            cache_dtype=cache_dtype,
         )
 
-        model_config.kv_cache_config._available_cache_memory = (
-            actual_kv_cache_size
-        )
+        kv_cache_config._available_cache_memory = actual_kv_cache_size
 
         total_size += actual_kv_cache_size
         # If the model is too large to fit in memory, and the user did not
@@ -127,6 +165,7 @@ class MemoryEstimator:
                 found_valid_max_length,
                 inferred_max_length,
                 _,
+                inferred_kv_cache_size,
             ) = self._find_valid_max_length(
                 pipeline_config,
                 pipeline_model,
@@ -141,51 +180,53 @@ class MemoryEstimator:
                     f"Truncated model's default max_length from {original_max_length} to {inferred_max_length} to fit in memory."
                 )
                 pipeline_config.max_length = inferred_max_length
+                actual_kv_cache_size = inferred_kv_cache_size
             else:
                 pipeline_config.max_length = 1
-
-            actual_kv_cache_size = self._calculate_kv_cache_size(
-                pipeline_model,
-                pipeline_config,
-                available_kv_cache_memory,
-                huggingface_config,
-                devices=devices,
-                kv_cache_config=model_config.kv_cache_config,
-                cache_dtype=model_config.quantization_encoding.cache_dtype,
-            )
+                actual_kv_cache_size = self._calculate_kv_cache_size(
+                    pipeline_model,
+                    pipeline_config,
+                    available_kv_cache_memory,
+                    huggingface_config,
+                    devices=devices,
+                    kv_cache_config=kv_cache_config,
+                    cache_dtype=cache_dtype,
+                )
             total_size = model_weights_size + actual_kv_cache_size
 
-        if free_memory:
-            free_memory_str = f" / {to_human_readable_bytes(free_memory)} free"
-
-        weights_str = ""
-        if model_weights_size:
-            weights_str = f"\n\t    Weights:                {to_human_readable_bytes(model_weights_size)}"
-
-        if not user_provided_max_length:
-            max_length_str = f"Auto-inferred max sequence length: {pipeline_config.max_length}"
-        else:
-            max_length_str = (
-                f"Current max sequence length: {pipeline_config.max_length}"
+        # Skip formatting entirely when the summary would not be emitted.
+        if logger.isEnabledFor(logging.INFO):
+            free_memory_str = (
+                f" / {to_human_readable_bytes(free_memory)} free"
+                if free_memory
+                else ""
             )
+            if not user_provided_max_length:
+                max_length_str = f"Auto-inferred max sequence length: {pipeline_config.max_length}"
+            else:
+                max_length_str = (
+                    f"Current max sequence length: {pipeline_config.max_length}"
+                )
+            if not user_provided_max_batch_size:
+                max_batch_size_str = f"Auto-inferred max batch size: {pipeline_config.max_batch_size}"
+            else:
+                max_batch_size_str = (
+                    f"Current max batch size: {pipeline_config.max_batch_size}"
+                )
 
-        if not user_provided_max_batch_size:
-            max_batch_size_str = f"Auto-inferred max batch size: {pipeline_config.max_batch_size}"
-        else:
-            max_batch_size_str = (
-                f"Current max batch size: {pipeline_config.max_batch_size}"
-            )
+            lines = ["Estimated memory consumption:"]
+            if model_weights_size:
+                lines.append(
+                    f"    Weights:                {to_human_readable_bytes(model_weights_size)}"
+                )
+            lines += [
+                f"    KVCache allocation:     {to_human_readable_bytes(actual_kv_cache_size)}",
+                f"    Total estimated:        {to_human_readable_bytes(model_weights_size + actual_kv_cache_size)} used{free_memory_str}",
+                max_length_str,
+                max_batch_size_str,
+            ]
+            logger.info("\n\n\t" + "\n\t".join(lines) + "\n")
 
-        logging_str = (
-            "\n"
-            f"\n\tEstimated memory consumption:"
-            f"{weights_str}"
-            f"\n\t    KVCache allocation:     {to_human_readable_bytes(actual_kv_cache_size)}"
-            f"\n\t    Total estimated:        {to_human_readable_bytes(model_weights_size + actual_kv_cache_size)} used{free_memory_str}"
-            f"\n\t{max_length_str}"
-            f"\n\t{max_batch_size_str}\n"
-        )
-        logger.info(logging_str)
         vram_usage_limit_scale = 0.95
 
         if isinstance(free_memory, (int, float)):
@@ -216,7 +257,7 @@ class MemoryEstimator:
         user_provided_max_batch_size: bool,
         huggingface_config: AutoConfig,
         devices: list[Device],
-    ) -> tuple[bool, int, int]:
+    ) -> tuple[bool, int, int, int]:
         """Binary search to find a valid max_length configuration.
 
         Returns:
@@ -224,6 +265,7 @@ class MemoryEstimator:
             - found_valid_max_length: Whether a valid max_length was found
             - inferred_max_length: The suggested max_length value
             - inferred_max_length_compatible_batch_size: Compatible batch size for the max_length
+            - kv_cache_size: KV cache size at the suggested max_length and batch size
         """
         assert pipeline_config.max_length is not None
         assert pipeline_config.max_batch_size is not None
@@ -232,11 +274,14 @@ class MemoryEstimator:
         lower = 1
         upper = pipeline_config.max_length
         inferred_max_length = upper
+        kv_cache_size = 0
 
         model_config = pipeline_config.model_config
         if not model_config.quantization_encoding:
             msg = "quantization_encoding must be provided in pipeline_config"
             raise ValueError(msg)
+        kv_cache_config = model_config.kv_cache_config
+        cache_dtype = model_config.quantization_encoding.cache_dtype
 
         while not found_valid_max_length:
             inferred_max_length = (lower + upper) // 2
@@ -249,8 +294,8 @@ class MemoryEstimator:
                     available_kv_cache_memory,
                     huggingface_config,
                     devices=devices,
-                    kv_cache_config=model_config.kv_cache_config,
-                    cache_dtype=model_config.quantization_encoding.cache_dtype,
+                    kv_cache_config=kv_cache_config,
+                    cache_dtype=cache_dtype,
                 )
 
             kv_cache_size = self._calculate_kv_cache_size(
@@ -259,8 +304,8 @@ class MemoryEstimator:
                 available_kv_cache_memory,
                 huggingface_config,
                 devices=devices,
-                kv_cache_config=model_config.kv_cache_config,
-                cache_dtype=model_config.quantization_encoding.cache_dtype,
+                kv_cache_config=kv_cache_config,
+                cache_dtype=cache_dtype,
             )
 
             if lower > upper:
@@ -278,6 +323,7 @@ class MemoryEstimator:
             found_valid_max_length,
             inferred_max_length,
             pipeline_config.max_batch_size,
+            kv_cache_size,
         )
 
     def _find_valid_batch_size(
@@ -307,25 +353,24 @@ class MemoryEstimator:
         lower = 1
         upper = cast(int, pipeline_config.max_batch_size)
         model_config = pipeline_config.model_config
+        if not model_config.quantization_encoding:
+            msg = "quantization_encoding must be provided in pipeline_config"
+            raise ValueError(msg)
+        kv_cache_config = model_config.kv_cache_config
+        cache_dtype = model_config.quantization_encoding.cache_dtype
 
         while not found_valid_max_batch_size:
             inferred_max_batch_size = (lower + upper) // 2
             pipeline_config.max_batch_size = inferred_max_batch_size
 
-            if not model_config.quantization_encoding:
-                msg = (
-                    "quantization_encoding must be provided in pipeline_config"
-                )
-                raise ValueError(msg)
-
             kv_cache_size = self._calculate_kv_cache_size(
                 pipeline_model,
                 pipeline_config,
                 available_kv_cache_memory,
                 huggingface_config,
                 devices=devices,
-                kv_cache_config=model_config.kv_cache_config,
-                cache_dtype=model_config.quantization_encoding.cache_dtype,
+                kv_cache_config=kv_cache_config,
+                cache_dtype=cache_dtype,
             )
 
             if lower > upper:
@@ -402,6 +447,7 @@ class MemoryEstimator:
             found_valid_max_length,
             inferred_max_length,
             inferred_max_length_compatible_batch_size,
+            _,
         ) = self._find_valid_max_length(
             pipeline_config,
             pipeline_model,
@@ -461,137 +507,25 @@ class MemoryEstimator:
             else ""
         )
 
-        msg = StringIO()
-        msg.write(
-            f"Estimated model and kv cache memory use exceeds available memory ({to_human_readable_bytes(total_size)} {free_memory_str}). Try "
-        )
-
-        if not found_valid_max_length and not found_valid_max_batch_size:
-            msg.write(
-                "reducing --max-length or --max-batch-size, finding a smaller model, or using a device with more memory."
-            )
-
-        elif user_provided_max_length:
-            self._add_user_provided_max_length_suggestions(
-                msg,
-                user_provided_max_batch_size,
-                found_valid_max_length,
-                found_valid_max_batch_size,
-                inferred_max_length,
-                inferred_max_batch_size,
-                inferred_max_length_compatible_batch_size,
-            )
-        else:
-            self._add_default_max_length_suggestions(
-                msg,
+        suggestion = _OOM_SUGGESTION_TEMPLATES[
+            (
+                user_provided_max_length,
                 user_provided_max_batch_size,
                 found_valid_max_length,
                 found_valid_max_batch_size,
-                inferred_max_length,
-                inferred_max_batch_size,
-                inferred_max_length_compatible_batch_size,
-                original_max_length,
             )
-
-        msg.write(".")
-        return msg.getvalue()
-
-    def _add_user_provided_max_length_suggestions(
-        self,
-        msg: StringIO,
-        user_provided_max_batch_size: bool,
-        found_valid_max_length: bool,
-        found_valid_max_batch_size: bool,
-        inferred_max_length: int,
-        inferred_max_batch_size: int,
-        inferred_max_length_compatible_batch_size: int,
-    ) -> None:
-        """Add error message suggestions when user provided max_length.
-
-        This handles the top row of the truth table from the _raise_oom_error docstring.
-
-        Args:
-            msg: StringIO buffer to write message to
-            user_provided_max_batch_size: Whether user provided batch size
-            found_valid_max_length: Whether valid max_length was found
-            found_valid_max_batch_size: Whether valid batch size was found
-            inferred_max_length: Suggested max_length value
-            inferred_max_batch_size: Suggested batch size value
-            inferred_max_length_compatible_batch_size: Compatible batch size for max_length
-        """
-        if not user_provided_max_batch_size:
-            if found_valid_max_length:
-                msg.write(
-                    f"reducing --max-length to {inferred_max_length} "
-                    f"(supports batch size of {inferred_max_length_compatible_batch_size})"
-                )
-            else:
-                msg.write("reducing --max-length or --max-batch-size")
-        else:
-            if found_valid_max_length:
-                msg.write(
-                    f"reducing --max-length to {inferred_max_length} and "
-                    f"--max-batch-size to {inferred_max_length_compatible_batch_size})"
-                )
-
-            if found_valid_max_batch_size:
-                if found_valid_max_length:
-                    msg.write(" or ")
-                msg.write(
-                    f"reducing --max-batch-size to {inferred_max_batch_size}"
-                )
-
-    def _add_default_max_length_suggestions(
-        self,
-        msg: StringIO,
-        user_provided_max_batch_size: bool,
-        found_valid_max_length: bool,
-        found_valid_max_batch_size: bool,
-        inferred_max_length: int,
-        inferred_max_batch_size: int,
-        inferred_max_length_compatible_batch_size: int,
-        original_max_length: int,
-    ) -> None:
-        """Add error message suggestions when max_length was set to default.
-
-        This handles the bottom row of the truth table from the _raise_oom_error docstring.
-
-        Args:
-            msg: StringIO buffer to write message to
-            user_provided_max_batch_size: Whether user provided batch size
-            found_valid_max_length: Whether valid max_length was found
-            found_valid_max_batch_size: Whether valid batch size was found
-            inferred_max_length: Suggested max_length value
-            inferred_max_batch_size: Suggested batch size value
-            inferred_max_length_compatible_batch_size: Compatible batch size for max_length
-            original_max_length: Original max_length value before modifications
-        """
-        if not user_provided_max_batch_size:
-            if found_valid_max_length:
-                msg.write(
-                    f"setting --max-length to {inferred_max_length} and "
-                    f"--max-batch-size to {inferred_max_length_compatible_batch_size})"
-                )
-
-            if found_valid_max_batch_size:
-                if found_valid_max_length:
-                    msg.write(" or ")
-                msg.write(
-                    f"setting --max-batch-size to {inferred_max_batch_size}"
-                )
-
-        else:
-            if found_valid_max_batch_size:
-                msg.write(
-                    f"reducing --max-batch-size to {inferred_max_batch_size}"
-                )
-            if found_valid_max_length:
-                if found_valid_max_batch_size:
-                    msg.write(" or ")
-                msg.write(
-                    f"setting --max-length to {inferred_max_length} "
-                    f"(currently defaulted to {original_max_length})"
-                )
+        ].format_map(
+            {
+                "inferred_max_length": inferred_max_length,
+                "inferred_max_batch_size": inferred_max_batch_size,
+                "inferred_max_length_compatible_batch_size": inferred_max_length_compatible_batch_size,
+                "original_max_length": original_max_length,
+            }
+        )
+        return (
+            f"Estimated model and kv cache memory use exceeds available memory ({to_human_readable_bytes(total_size)} {free_memory_str}). Try "
+            f"{suggestion}."
+        )
 
     def _infer_optimal_batch_size(
         self,
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from functools import cached_property
 from pathlib import Path
@@ -41,6 +42,10 @@ from .weight_path_parser import WeightPathParser
 
 logger = logging.getLogger("max.pipelines")
 
+# Maximum number of concurrent HuggingFace requests when checking that the
+# weight files exist remotely.
+_MAX_FILE_EXISTS_WORKERS = 8
+
 
 @dataclass
 class MAXModelConfigBase(MAXConfig):
@@ -412,14 +417,7 @@ class MAXModelConfig(MAXModelConfigBase):
             and weights_format != WeightsFormat.pytorch
         ):
             # Get the encoding of the first weight path file.
-            if os.path.exists(self.weight_path[0]):
-                file_encoding = SupportedEncoding.parse_from_file_name(
-                    str(self.weight_path[0])
-                )
-            else:
-                file_encoding = self.huggingface_weight_repo.encoding_for_file(
-                    self.weight_path[0]
-                )
+            _, file_encoding = self._first_weight_path_encoding()
 
             if file_encoding and file_encoding != self.quantization_encoding:
                 if self.allow_dtype_casting:
@@ -456,6 +454,24 @@ class MAXModelConfig(MAXModelConfigBase):
                     msg = f"quantization_encoding '{self.quantization_encoding}' is not supported by the repo '{self.huggingface_weight_repo.repo_id}'"
                     raise ValueError(msg)
 
+    def _first_weight_path_encoding(
+        self,
+    ) -> tuple[bool, Optional[SupportedEncoding]]:
+        """
+        Resolves the encoding of the first weight path file.
+
+        Returns:
+            Whether the file exists locally, and its encoding: parsed from the
+            file name for local files, otherwise looked up in the weight repo.
+        """
+        assert self.weight_path, "weight_path must be provided."
+        weight_path_str = str(self.weight_path[0])
+        if os.path.exists(weight_path_str):
+            return True, SupportedEncoding.parse_from_file_name(weight_path_str)
+        return False, self.huggingface_weight_repo.encoding_for_file(
+            self.weight_path[0]
+        )
+
     def _validate_and_resolve_without_given_quantization_encoding(
         self,
         weights_format: Optional[WeightsFormat],
@@ -470,37 +486,32 @@ class MAXModelConfig(MAXModelConfigBase):
 
         # If weight path is not None, infer the quantization_encoding from the weight_path.
         if self.weight_path and weights_format != WeightsFormat.pytorch:
-            if os.path.exists(self.weight_path[0]):
-                # Not currently supported. Infer encoding from local path.
-                if self.weight_path[0].suffix == ".safetensors":
-                    msg = "If a local safetensors file is provided, please provide a quantization_encoding."
-                    raise ValueError(msg)
-
-                if encoding := SupportedEncoding.parse_from_file_name(
-                    str(self.weight_path[0])
-                ):
-                    msg = f"encoding inferred from weights file: {encoding}"
-                    logger.debug(msg)
-                    self.quantization_encoding = encoding
+            is_local, encoding = self._first_weight_path_encoding()
+            # Inferring the encoding of a local safetensors file is not
+            # currently supported.
+            if is_local and self.weight_path[0].suffix == ".safetensors":
+                msg = "If a local safetensors file is provided, please provide a quantization_encoding."
+                raise ValueError(msg)
 
-            else:
-                if encoding := self.huggingface_weight_repo.encoding_for_file(
-                    self.weight_path[0]
-                ):
-                    msg = f"encoding inferred from weights file: {encoding}"
-                    logger.debug(msg)
-                    self.quantization_encoding = encoding
-                else:
-                    msg = f"encoding cannot be inferred from weights file: {self.weight_path[0]}, please pass a quantization_encoding explicitly."
-                    raise ValueError(msg)
+            if encoding:
+                logger.debug(
+                    "encoding inferred from weights file: %s", encoding
+                )
+                self.quantization_encoding = encoding
+            elif not is_local:
+                msg = f"encoding cannot be inferred from weights file: {self.weight_path[0]}, please pass a quantization_encoding explicitly."
+                raise ValueError(msg)
         else:
             # Check if the repo only has one quantization_encoding.
             supported_encodings = (
                 self.huggingface_weight_repo.supported_encodings
             )
             if len(supported_encodings) == 1:
-                msg = f"huggingface repo only has '{supported_encodings[0]}' weights, using '{supported_encodings[0]}'"
-                logger.debug(msg)
+                logger.debug(
+                    "huggingface repo only has '%s' weights, using '%s'",
+                    supported_encodings[0],
+                    supported_encodings[0],
+                )
                 self.quantization_encoding = supported_encodings[0]
             elif not self.default_device_spec.device_type == "cpu":
                 # TODO(AITLIB-137): replace this with more full featured logic.
@@ -510,8 +521,10 @@ class MAXModelConfig(MAXModelConfigBase):
                 elif SupportedEncoding.bfloat16 in supported_encodings:
                     self.quantization_encoding = SupportedEncoding.bfloat16
             else:
-                msg = f"encoding not provided, using default encoding of {default_encoding}"
-                logger.debug(msg)
+                logger.debug(
+                    "encoding not provided, using default encoding of %s",
+                    default_encoding,
+                )
                 self.quantization_encoding = default_encoding
 
     def _validate_quantization_encoding_device_compatibility(
@@ -616,8 +629,9 @@ class MAXModelConfig(MAXModelConfigBase):
             and supported_cache_strategies
         ):
             default_strategy = supported_cache_strategies[0]
-            msg = f"default cache_strategy of '{default_strategy}' enabled"
-            logger.debug(msg)
+            logger.debug(
+                "default cache_strategy of '%s' enabled", default_strategy
+            )
 
             self.kv_cache_config.cache_strategy = default_strategy
         elif (
@@ -637,7 +651,9 @@ class MAXModelConfig(MAXModelConfigBase):
         # a model_path and weight_paths are available.
         assert self.weight_path, "weight_path must be provided."
         repo = self.huggingface_weight_repo
-        for path in self.weight_path:
+        remote_paths: list[str] = []
+        # Deduplicate (preserving order) so each file is only checked once.
+        for path in dict.fromkeys(self.weight_path):
             path_str = str(path)
             # Check if file exists locally (direct, local repo, or cache).
             if self._local_weight_path(path):
@@ -652,19 +668,30 @@ class MAXModelConfig(MAXModelConfigBase):
                         f"weight file '{path_str}' not found within the local repository path '{repo.repo_id}'"
                     )
             elif repo.repo_type == RepoType.online:
-                # Verify that it exists on Huggingface.
-                if not repo.file_exists(path_str):
-                    msg = (
-                        f"weight_path: '{path_str}' does not exist locally or in cache,"  # noqa: E501
-                        f" and '{repo.repo_id}/{path_str}' does"
-                        " not exist on HuggingFace."
-                    )
-                    raise ValueError(msg)
+                # Verified on Huggingface below.
+                remote_paths.append(path_str)
             else:
                 raise RuntimeError(
                     f"unexpected repository type: {repo.repo_type}"
                 )
 
+        if not remote_paths:
+            return
+
+        # Each check is a network round trip, so issue them concurrently.
+        with ThreadPoolExecutor(
+            max_workers=min(len(remote_paths), _MAX_FILE_EXISTS_WORKERS)
+        ) as executor:
+            remote_exists = list(executor.map(repo.file_exists, remote_paths))
+        for path_str, exists in zip(remote_paths, remote_exists):
+            if not exists:
+                msg = (
+                    f"weight_path: '{path_str}' does not exist locally or in cache,"  # noqa: E501
+                    f" and '{repo.repo_id}/{path_str}' does"
+                    " not exist on HuggingFace."
+                )
+                raise ValueError(msg)
+
     def _finalize_encoding_config(self) -> None:
         """
         Finalizes the encoding config.
@@ -713,7 +740,9 @@ class MAXModelConfig(MAXModelConfigBase):
         # NOTE(bduke): do this even for online repositories, because upstream
         # code originating from `huggingface_hub.hf_hub_download` returns
         # absolute paths for cached files.
-        if relative_path.exists() and relative_path.is_file():
+        # `is_file` is a single stat and is False for missing paths, so no
+        # separate `exists` check is needed.
+        if relative_path.is_file():
             return str(relative_path.resolve())
 
         # 1. Handle local repository paths.
@@ -17,6 +17,8 @@ from __future__ import annotations
 
 import functools
 import logging
+from collections.abc import Iterable, Mapping
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Callable, Optional, Union, cast
 
 import torch
@@ -86,15 +88,35 @@ def get_pipeline_for_task(
         raise ValueError(msg)
 
 
-_HF_PIPELINE_TASK_MAP: dict[
+_HF_PIPELINE_TASK_MAP: Mapping[
     PipelineTask, type[HFTextGenerationPipeline] | type[HFEmbeddingsPipeline]
-] = {
-    PipelineTask.TEXT_GENERATION: HFTextGenerationPipeline,
-    PipelineTask.EMBEDDINGS_GENERATION: HFEmbeddingsPipeline,
-}
+] = MappingProxyType(
+    {
+        PipelineTask.TEXT_GENERATION: HFTextGenerationPipeline,
+        PipelineTask.EMBEDDINGS_GENERATION: HFEmbeddingsPipeline,
+    }
+)
+
+# Pipeline models whose TextTokenizer needs the Llama whitespace decoding fix.
+# Matched by class name since the architecture packages import this module.
+_LLAMA_WHITESPACE_FIX_MODELS = frozenset({"MistralModel", "Phi3Model"})
 
 
 class SupportedArchitecture:
+    __slots__ = (
+        "default_encoding",
+        "default_weights_format",
+        "example_repo_ids",
+        "multi_gpu_supported",
+        "name",
+        "pipeline_model",
+        "rope_type",
+        "supported_encodings",
+        "task",
+        "tokenizer",
+        "weight_adapters",
+    )
+
     def __init__(
         self,
         name: str,
@@ -222,15 +244,34 @@ class PipelineRegistry:
         allow_override: bool = False,
     ) -> None:
         """Add new architecture to registry."""
-        if architecture.name in self.architectures:
-            if not allow_override:
-                msg = f"Refusing to override existing architecture for '{architecture.name}'"
-                raise ValueError(msg)
-            logger.warning(
-                f"Overriding existing architecture for '{architecture.name}'"
-            )
+        self.register_many([architecture], allow_override=allow_override)
 
-        self.architectures[architecture.name] = architecture
+    def register_many(
+        self,
+        architectures: Iterable[SupportedArchitecture],
+        *,
+        allow_override: bool = False,
+    ) -> None:
+        """Add several architectures to the registry at once.
+
+        All architectures are validated before any is added, so a conflict
+        leaves the registry unchanged.
+        """
+        new_architectures: dict[str, SupportedArchitecture] = {}
+        for architecture in architectures:
+            if (
+                architecture.name in self.architectures
+                or architecture.name in new_architectures
+            ):
+                if not allow_override:
+                    msg = f"Refusing to override existing architecture for '{architecture.name}'"
+                    raise ValueError(msg)
+                logger.warning(
+                    f"Overriding existing architecture for '{architecture.name}'"
+                )
+            new_architectures[architecture.name] = architecture
+
+        self.architectures.update(new_architectures)
 
     def retrieve_architecture(
         self, huggingface_repo: HuggingFaceRepo
@@ -248,11 +289,13 @@ class PipelineRegistry:
             return None
 
         for architecture_name in architecture_names:
-            if architecture_name in self.architectures:
-                return self.architectures[architecture_name]
+            architecture = self.architectures.get(architecture_name)
+            if architecture is not None:
+                return architecture
 
         logger.debug(
-            f"optimized architecture not available for {huggingface_repo.repo_id} in MAX REGISTRY"
+            "optimized architecture not available for %s in MAX REGISTRY",
+            huggingface_repo.repo_id,
         )
 
         return None
@@ -426,7 +469,7 @@ class PipelineRegistry:
 
             tokenizer: PipelineTokenizer
             if (
-                arch.pipeline_model.__name__ in ("MistralModel", "Phi3Model")
+                arch.pipeline_model.__name__ in _LLAMA_WHITESPACE_FIX_MODELS
                 and arch.tokenizer is TextTokenizer
             ):
                 text_tokenizer = cast(type[TextTokenizer], arch.tokenizer)
@@ -466,6 +509,7 @@ class PipelineRegistry:
     ]:
         tokenizer: PipelineTokenizer
         pipeline_factory: Callable[[], PipelineTypes]
+        model_config = pipeline_config.model_config
 
         if pipeline_config.engine == PipelineEngine.MAX:
             pipeline_class = get_pipeline_for_task(task, pipeline_config)
@@ -476,26 +520,27 @@ class PipelineRegistry:
                 arch = self.architectures[override_architecture]
             else:
                 arch = self.retrieve_architecture(
-                    huggingface_repo=pipeline_config.model_config.huggingface_model_repo
+                    huggingface_repo=model_config.huggingface_model_repo
                 )
 
             # Load HuggingFace Config
-            huggingface_config = pipeline_config.model_config.huggingface_config
+            huggingface_config = model_config.huggingface_config
 
             # Architecture should not be None here, as the engine is MAX.
             assert arch is not None
-            devices = load_devices(pipeline_config.model_config.device_specs)
-            logger.info(
-                self._load_logging_message(
-                    pipeline_config=pipeline_config,
-                    tokenizer_type=arch.tokenizer_cls,
-                    pipeline_model=arch.pipeline_model.__name__,
-                    pipeline_name=pipeline_class.__name__,
-                    architecture_id=arch.name,
-                    factory=True,
-                    devices=devices,
+            devices = load_devices(model_config.device_specs)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    self._load_logging_message(
+                        pipeline_config=pipeline_config,
+                        tokenizer_type=arch.tokenizer_cls,
+                        pipeline_model=arch.pipeline_model.__name__,
+                        pipeline_name=pipeline_class.__name__,
+                        architecture_id=arch.name,
+                        factory=True,
+                        devices=devices,
+                    )
                 )
-            )
 
             max_length = arch.pipeline_model.calculate_max_seq_len(
                 pipeline_config, huggingface_config=huggingface_config
@@ -510,25 +555,25 @@ class PipelineRegistry:
             # https://linear.app/modularml/issue/AIPIPE-197/add-support-for-mistral-7b-instruct-v03
             # TODO: remove this pipeline_model.__name__ check
             if (
-                arch.pipeline_model.__name__ in ("MistralModel", "Phi3Model")
+                arch.pipeline_model.__name__ in _LLAMA_WHITESPACE_FIX_MODELS
                 and arch.tokenizer is TextTokenizer
             ):
                 text_tokenizer = cast(type[TextTokenizer], arch.tokenizer)
                 tokenizer = text_tokenizer(
-                    pipeline_config.model_config.model_path,
-                    revision=pipeline_config.model_config.huggingface_model_revision,
+                    model_config.model_path,
+                    revision=model_config.huggingface_model_revision,
                     max_length=max_length,
                     max_new_tokens=pipeline_config.max_new_tokens,
-                    trust_remote_code=pipeline_config.model_config.trust_remote_code,
+                    trust_remote_code=model_config.trust_remote_code,
                     enable_llama_whitespace_fix=True,
                 )
             else:
                 tokenizer = arch.tokenizer(
-                    model_path=pipeline_config.model_config.model_path,
-                    revision=pipeline_config.model_config.huggingface_model_revision,
+                    model_path=model_config.model_path,
+                    revision=model_config.huggingface_model_revision,
                     max_length=max_length,
                     max_new_tokens=pipeline_config.max_new_tokens,
-                    trust_remote_code=pipeline_config.model_config.trust_remote_code,
+                    trust_remote_code=model_config.trust_remote_code,
                     pipeline_config=pipeline_config,
                 )
             pipeline_factory = cast(
@@ -545,37 +590,38 @@ class PipelineRegistry:
             pipeline_config = self._set_hf_pipeline_defaults(pipeline_config)
             hf_pipeline_class = _HF_PIPELINE_TASK_MAP[task]
 
-            torch_device_type = str(
-                pipeline_config.model_config.device_specs[0].device_type
-            )
-            if (
-                pipeline_config.model_config.device_specs[0].device_type
-                == "gpu"
-            ):
+            device_type = model_config.device_specs[0].device_type
+            torch_device_type = str(device_type)
+            if device_type == "gpu":
                 torch_device_type = "cuda"
-                torch.multiprocessing.set_start_method("spawn", force=True)
+                # The start method is process-wide, so only force it once.
+                if (
+                    torch.multiprocessing.get_start_method(allow_none=True)
+                    != "spawn"
+                ):
+                    torch.multiprocessing.set_start_method("spawn", force=True)
 
             # Generalized pipeline
             tokenizer = TextTokenizer(
-                pipeline_config.model_config.model_path,
-                revision=pipeline_config.model_config.huggingface_model_revision,
+                model_config.model_path,
+                revision=model_config.huggingface_model_revision,
                 max_length=pipeline_config.max_length or HF_DEFAULT_MAX_SEQ_LEN,
                 max_new_tokens=pipeline_config.max_new_tokens,
-                trust_remote_code=pipeline_config.model_config.trust_remote_code,
+                trust_remote_code=model_config.trust_remote_code,
                 enable_llama_whitespace_fix=True,
             )
-            logger.info(
-                self._load_logging_message(
-                    pipeline_config=pipeline_config,
-                    tokenizer_type=TextTokenizer,
-                    pipeline_model="",
-                    pipeline_name=hf_pipeline_class.__name__,
-                    factory=True,
-                    devices=load_devices(
-                        pipeline_config.model_config.device_specs
-                    ),
+            devices = load_devices(model_config.device_specs)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    self._load_logging_message(
+                        pipeline_config=pipeline_config,
+                        tokenizer_type=TextTokenizer,
+                        pipeline_model="",
+                        pipeline_name=hf_pipeline_class.__name__,
+                        factory=True,
+                        devices=devices,
+                    )
                 )
-            )
             pipeline_factory = cast(
                 Callable[[], PipelineTypes],
                 functools.partial(
@@ -0,0 +1,196 @@
+# ===----------------------------------------------------------------------=== #
+# Copyright (c) 2025, Modular Inc. All rights reserved.
+#
+# Licensed under the Apache License v2.0 with LLVM Exceptions:
+# https://llvm.org/LICENSE.txt
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===----------------------------------------------------------------------=== #
+"""Tests that linear layers stage derived weights once per graph block."""
+
+from max.dtype import DType
+from max.graph import DeviceRef, Graph, TensorType, Weight
+from max.graph.quantization import QuantizationConfig, QuantizationEncoding
+from max.nn import (
+    Float8Config,
+    Float8InputScaleSpec,
+    Float8ScaleGranularity,
+    Float8ScaleOrigin,
+    Float8WeightScaleSpec,
+    GPTQLinear,
+    Linear,
+    LinearV1,
+)
+
+IN_DIM = 256
+OUT_DIM = 64
+
+
+def input_type(dtype: DType, device: DeviceRef) -> TensorType:
+    return TensorType(dtype, [2, IN_DIM], device=device)
+
+
+def test_linear_reuses_staged_weight_in_same_graph() -> None:
+    layer = Linear(IN_DIM, OUT_DIM, DType.float32, DeviceRef.CPU())
+    with Graph(
+        "linear_twice", input_types=[input_type(DType.float32, layer.device)]
+    ) as graph:
+        x = graph.inputs[0].tensor
+        graph.output(layer(x) + layer(x))
+
+    assert str(graph).count("rmo.matmul") == 2
+    assert str(graph).count("rmo.mo.transpose") == 1
+
+
+def test_linear_reuses_clipped_weight_in_same_graph() -> None:
+    layer = Linear(
+        IN_DIM, OUT_DIM, DType.float32, DeviceRef.CPU(), clip_weight=1.0
+    )
+    with Graph(
+        "linear_clipped", input_types=[input_type(DType.float32, layer.device)]
+    ) as graph:
+        x = graph.inputs[0].tensor
+        graph.output(layer(x) + layer(x))
+
+    assert str(graph).count("rmo.min") == 1
+    assert str(graph).count("rmo.max") == 1
+    assert str(graph).count("rmo.mo.transpose") == 1
+
+
+def test_linear_reuses_float8_weight_scale_in_same_graph() -> None:
+    float8_config = Float8Config(
+        input_scale=Float8InputScaleSpec(
+            granularity=Float8ScaleGranularity.COLWISE,
+            origin=Float8ScaleOrigin.DYNAMIC,
+            dtype=DType.bfloat16,
+        ),
+        weight_scale=Float8WeightScaleSpec(
+            granularity=Float8ScaleGranularity.ROWWISE,
+            dtype=DType.bfloat16,
+        ),
+        mlp_in_float8=set(),
+        attn_qkv_in_float8=set(),
+    )
+    layer = Linear(
+        IN_DIM,
+        OUT_DIM,
+        DType.float8_e4m3fn,
+        DeviceRef.GPU(),
+        float8_config=float8_config,
+    )
+    with Graph(
+        "linear_float8", input_types=[input_type(DType.bfloat16, layer.device)]
+    ) as graph:
+        x = graph.inputs[0].tensor
+        graph.output(layer(x) + layer(x))
+
+    # The CPU weight scale is transferred to the layer's device once.
+    assert str(graph).count("rmo.mo.transfer") == 1
+
+
+def test_gptq_linear_reuses_packed_weight_in_same_graph() -> None:
+    layer = GPTQLinear(
+        IN_DIM,
+        OUT_DIM,
+        DType.bfloat16,
+        DeviceRef.GPU(),
+        quantization_encoding=QuantizationEncoding.GPTQ,
+        quantization_config=QuantizationConfig(
+            quant_method="gptq",
+            bits=4,
+            group_size=128,
+            desc_act=True,
+            sym=True,
+        ),
+    )
+    with Graph(
+        "gptq_linear", input_types=[input_type(DType.bfloat16, layer.device)]
+    ) as graph:
+        x = graph.inputs[0].tensor
+        graph.output(layer(x) + layer(x))
+
+    assert str(graph).count("rmo.mo.gather") == 2
+    assert str(graph).count("rmo.concat") == 1
+
+
+def test_linear_restages_in_new_graph() -> None:
+    layer = Linear(IN_DIM, OUT_DIM, DType.float32, DeviceRef.CPU())
+    graphs = []
+    for name in ("linear_first", "linear_second"):
+        with Graph(
+            name, input_types=[input_type(DType.float32, layer.device)]
+        ) as graph:
+            graph.output(layer(graph.inputs[0].tensor))
+        graphs.append(graph)
+
+    for graph in graphs:
+        assert str(graph).count("rmo.mo.transpose") == 1
+
+
+def test_linear_restages_in_subgraph() -> None:
+    layer = Linear(IN_DIM, OUT_DIM, DType.float32, DeviceRef.CPU())
+    with Graph(
+        "linear_outer", input_types=[input_type(DType.float32, layer.device)]
+    ) as graph:
+        out = layer(graph.inputs[0].tensor)
+
+        with graph.add_subgraph(
+            "linear_sub",
+            input_types=[input_type(DType.float32, layer.device)],
+        ) as subgraph:
+            x = subgraph.inputs[0].tensor
+            subgraph.output(layer(x) + layer(x))
+
+        graph.output(out)
+
+    assert str(graph).count("rmo.mo.transpose") == 1
+    assert str(subgraph).count("rmo.mo.transpose") == 1
+
+
+def test_linear_restages_replaced_weight() -> None:
+    layer = Linear(IN_DIM, OUT_DIM, DType.float32, DeviceRef.CPU())
+    with Graph(
+        "linear_replaced", input_types=[input_type(DType.float32, layer.device)]
+    ) as graph:
+        x = graph.inputs[0].tensor
+        out = layer(x)
+        layer.weight = Weight(
+            "replaced_weight",
+            dtype=DType.float32,
+            shape=[OUT_DIM, IN_DIM],
+            device=layer.device,
+        )
+        graph.output(out + layer(x))
+
+    assert str(graph).count("rmo.mo.transpose") == 2
+
+
+def test_linear_v1_reuses_staged_weight_and_bias_in_same_graph() -> None:
+    layer = LinearV1(
+        weight=Weight(
+            "weight",
+            dtype=DType.float32,
+            shape=[OUT_DIM, IN_DIM],
+            device=DeviceRef.CPU(),
+        ),
+        bias=Weight(
+            "bias",
+            dtype=DType.float32,
+            shape=[OUT_DIM],
+            device=DeviceRef.CPU(),
+        ),
+    )
+    device = DeviceRef.GPU()
+    with Graph(
+        "linear_v1_twice", input_types=[input_type(DType.float32, device)]
+    ) as graph:
+        x = graph.inputs[0].tensor
+        graph.output(layer(x) + layer(x))
+
+    # One transfer each for the weight and the bias.
+    assert str(graph).count("rmo.mo.transfer") == 2
+    assert str(graph).count("rmo.mo.transpose") == 1